@@ -40,6 +40,7 @@ class GoldenConfig(NautobotAppConfig):
             "trim_blocks": True,
             "lstrip_blocks": False,
         },
+        "jinja_bytecode_cache_dir": None,
     }
     constance_config = {
         "DEFAULT_FRAMEWORK": ConstanceConfigItem(
@@ -53,7 +53,7 @@ class SOTAggDeviceDetailView(APIView):
 class ComplianceRuleViewSet(NautobotModelViewSet):  # pylint:disable=too-many-ancestors
     """API viewset for interacting with ComplianceRule objects."""
 
-    queryset = models.ComplianceRule.objects.all()
+    queryset = models.ComplianceRule.objects.select_related("feature", "platform")
     serializer_class = serializers.ComplianceRuleSerializer
     filterset_class = filters.ComplianceRuleFilterSet
 
@@ -69,7 +69,7 @@ class ComplianceFeatureViewSet(NautobotModelViewSet):  # pylint:disable=too-many
 class ConfigComplianceViewSet(NautobotModelViewSet):  # pylint:disable=too-many-ancestors
     """API viewset for interacting with ConfigCompliance objects."""
 
-    queryset = models.ConfigCompliance.objects.all()
+    queryset = models.ConfigCompliance.objects.select_related("device", "rule__feature", "rule__platform")
     serializer_class = serializers.ConfigComplianceSerializer
     filterset_class = filters.ConfigComplianceFilterSet
 
@@ -77,7 +77,7 @@ class ConfigComplianceViewSet(NautobotModelViewSet):  # pylint:disable=too-many-
 class GoldenConfigViewSet(NautobotModelViewSet):  # pylint:disable=too-many-ancestors
     """API viewset for interacting with GoldenConfig objects."""
 
-    queryset = models.GoldenConfig.objects.all()
+    queryset = models.GoldenConfig.objects.select_related("device")
     serializer_class = serializers.GoldenConfigSerializer
     filterset_class = filters.GoldenConfigFilterSet
 
@@ -2,51 +2,46 @@
 
 import django_filters
 
-from nautobot.core.filters import MultiValueDateTimeFilter, TreeNodeMultipleChoiceFilter, SearchFilter
+from nautobot.core.filters import (
+    MultiValueCharFilter,
+    MultiValueDateTimeFilter,
+    MultiValueUUIDFilter,
+    TreeNodeMultipleChoiceFilter,
+    SearchFilter,
+)
 from nautobot.dcim.models import Device, DeviceType, Location, Manufacturer, Platform, Rack, RackGroup
 from nautobot.extras.filters import NaturalKeyOrPKMultipleChoiceFilter, NautobotFilterSet, StatusFilter
-from nautobot.extras.models import JobResult, Role, Status
+from nautobot.extras.models import Role, Status
 from nautobot.tenancy.models import Tenant, TenantGroup
 
 from nautobot_golden_config import models
 
 
-class GoldenConfigFilterSet(NautobotFilterSet):
-    """Filter capabilities for GoldenConfig instances."""
+class DeviceScopeFilterSetMixin(django_filters.FilterSet):
+    """Filters on the attributes of the related Device, shared by the device-centric filter sets."""
 
-    @staticmethod
-    def _get_filter_lookup_dict(existing_filter):
-        """Extend method to account for isnull on datetime types."""
-        # Choose the lookup expression map based on the filter type
-        lookup_map = NautobotFilterSet._get_filter_lookup_dict(existing_filter)
-        if isinstance(existing_filter, MultiValueDateTimeFilter):
-            lookup_map.update({"isnull": "isnull"})
-        return lookup_map
+    # All of these follow many-to-one relations through `device`, so they can never return duplicate rows and
+    # the `SELECT DISTINCT` that multiple choice filters apply by default is skipped.
 
-    q = SearchFilter(
-        filter_predicates={
-            "device__name": {
-                "lookup_expr": "icontains",
-                "preprocessor": str,
-            },
-        },
-    )
     tenant_group_id = TreeNodeMultipleChoiceFilter(
         queryset=TenantGroup.objects.all(),
         field_name="device__tenant__tenant_group",
         to_field_name="id",
+        distinct=False,
         label="Tenant Group (ID)",
     )
     tenant_group = TreeNodeMultipleChoiceFilter(
         queryset=TenantGroup.objects.all(),
         field_name="device__tenant__tenant_group",
         to_field_name="name",
+        distinct=False,
         label="Tenant Group (name)",
     )
     tenant = NaturalKeyOrPKMultipleChoiceFilter(
-        queryset=Tenant.objects.all(),
+        queryset=Tenant.objects.only("id", "name"),
         field_name="device__tenant",
         to_field_name="name",
+        distinct=False,
         label="Tenant (name or ID)",
     )
     location_id = TreeNodeMultipleChoiceFilter(
@@ -55,6 +50,7 @@ class GoldenConfigFilterSet(NautobotFilterSet):
         queryset=Location.objects.all(),
         field_name="device__location",
         to_field_name="id",
+        distinct=False,
         label="Location (ID)",
     )
     location = TreeNodeMultipleChoiceFilter(
@@ -63,59 +59,104 @@ class GoldenConfigFilterSet(NautobotFilterSet):
         queryset=Location.objects.all(),
         field_name="device__location",
         to_field_name="name",
+        distinct=False,
         label="Location (name)",
     )
     rack_group_id = TreeNodeMultipleChoiceFilter(
         queryset=RackGroup.objects.all(),
         field_name="device__rack__rack_group",
         to_field_name="id",
+        distinct=False,
         label="Rack group (ID)",
     )
     rack_group = TreeNodeMultipleChoiceFilter(
         queryset=RackGroup.objects.all(),
         field_name="device__rack__rack_group",
         to_field_name="name",
+        distinct=False,
         label="Rack group (name)",
     )
     rack = NaturalKeyOrPKMultipleChoiceFilter(
         field_name="device__rack",
         queryset=Rack.objects.all(),
         to_field_name="name",
+        distinct=False,
         label="Rack (name or ID)",
     )
     role = NaturalKeyOrPKMultipleChoiceFilter(
         field_name="device__role",
-        queryset=Role.objects.filter(content_types__model="device"),
+        queryset=Role.objects.filter(content_types__model="device").only("id", "name"),
         to_field_name="name",
+        distinct=False,
         label="Role (name or ID)",
     )
     manufacturer = NaturalKeyOrPKMultipleChoiceFilter(
         field_name="device__device_type__manufacturer",
-        queryset=Manufacturer.objects.all(),
+        queryset=Manufacturer.objects.only("id", "name"),
         to_field_name="name",
+        distinct=False,
         label="Manufacturer (name or ID)",
     )
     platform = NaturalKeyOrPKMultipleChoiceFilter(
         field_name="device__platform",
-        queryset=Platform.objects.all(),
+        queryset=Platform.objects.only("id", "name"),
         to_field_name="name",
+        distinct=False,
         label="Platform (name or ID)",
     )
+
+
+class NameSearchFilterSetMixin(django_filters.FilterSet):
+    """Search on the `name` field."""
+
+    q = SearchFilter(
+        filter_predicates={
+            "name": {
+                "lookup_expr": "icontains",
+                "preprocessor": str,
+            },
+        },
+    )
+
+
+class GoldenConfigFilterSet(NautobotFilterSet, DeviceScopeFilterSetMixin):
+    """Filter capabilities for GoldenConfig instances."""
+
+    @staticmethod
+    def _get_filter_lookup_dict(existing_filter):
+        """Extend method to account for isnull on datetime types."""
+        # Choose the lookup expression map based on the filter type
+        lookup_map = NautobotFilterSet._get_filter_lookup_dict(existing_filter)
+        if isinstance(existing_filter, MultiValueDateTimeFilter):
+            lookup_map.update({"isnull": "isnull"})
+        return lookup_map
+
+    q = SearchFilter(
+        filter_predicates={
+            "device__name": {
+                "lookup_expr": "icontains",
+                "preprocessor": str,
+            },
+        },
+    )
     device_status = StatusFilter(
         field_name="device__status",
-        queryset=Status.objects.all(),
+        queryset=Status.objects.only("id", "name"),
+        distinct=False,
         label="Device Status",
     )
     device_type = NaturalKeyOrPKMultipleChoiceFilter(
         field_name="device__device_type",
         queryset=DeviceType.objects.all(),
         to_field_name="model",
+        distinct=False,
         label="DeviceType (model or ID)",
     )
     device = NaturalKeyOrPKMultipleChoiceFilter(
         field_name="device",
         queryset=Device.objects.all(),
         to_field_name="name",
+        distinct=False,
         label="Device (name or ID)",
     )
 
@@ -123,7 +164,6 @@ class GoldenConfigFilterSet(NautobotFilterSet):
         """Meta class attributes for GoldenConfigFilter."""
 
         model = models.GoldenConfig
-        distinct = True
         fields = [
             "id",
             "backup_config",
@@ -141,15 +181,14 @@ class GoldenConfigFilterSet(NautobotFilterSet):
 class ConfigComplianceFilterSet(GoldenConfigFilterSet):  # pylint: disable=too-many-ancestors
     """Filter capabilities for ConfigCompliance instances."""
 
-    feature_id = django_filters.ModelMultipleChoiceFilter(
+    feature_id = MultiValueUUIDFilter(
         field_name="rule__feature",
-        queryset=models.ComplianceFeature.objects.all(),
+        distinct=False,
         label="ComplianceFeature (ID)",
     )
-    feature = django_filters.ModelMultipleChoiceFilter(
+    feature = MultiValueCharFilter(
         field_name="rule__feature__slug",
-        queryset=models.ComplianceFeature.objects.all(),
-        to_field_name="slug",
+        distinct=False,
         label="ComplianceFeature (slug)",
     )
 
@@ -160,18 +199,9 @@ class ConfigComplianceFilterSet(GoldenConfigFilterSet):  # pylint: disable=too-m
         fields = ["id", "compliance", "actual", "intended", "missing", "extra", "ordered", "compliance_int", "rule"]
 
 
-class ComplianceFeatureFilterSet(NautobotFilterSet):
+class ComplianceFeatureFilterSet(NautobotFilterSet, NameSearchFilterSetMixin):
     """Inherits Base Class NautobotFilterSet."""
 
-    q = SearchFilter(
-        filter_predicates={
-            "name": {
-                "lookup_expr": "icontains",
-                "preprocessor": str,
-            },
-        },
-    )
-
     class Meta:
         """Boilerplate filter Meta data for compliance feature."""
 
@@ -192,7 +222,7 @@ class ComplianceRuleFilterSet(NautobotFilterSet):
     )
     platform = NaturalKeyOrPKMultipleChoiceFilter(
         field_name="platform",
-        queryset=Platform.objects.all(),
+        queryset=Platform.objects.only("id", "name"),
         to_field_name="name",
         label="Platform (name or ID)",
     )
@@ -204,20 +234,12 @@ class ComplianceRuleFilterSet(NautobotFilterSet):
         fields = ["feature", "id"]
 
 
-class ConfigRemoveFilterSet(NautobotFilterSet):
+class ConfigRemoveFilterSet(NautobotFilterSet, NameSearchFilterSetMixin):
     """Inherits Base Class NautobotFilterSet."""
 
-    q = SearchFilter(
-        filter_predicates={
-            "name": {
-                "lookup_expr": "icontains",
-                "preprocessor": str,
-            },
-        },
-    )
     platform = NaturalKeyOrPKMultipleChoiceFilter(
         field_name="platform",
-        queryset=Platform.objects.all(),
+        queryset=Platform.objects.only("id", "name"),
         to_field_name="name",
         label="Platform (name or ID)",
     )
@@ -229,20 +251,12 @@ class ConfigRemoveFilterSet(NautobotFilterSet):
         fields = ["id", "name"]
 
 
-class ConfigReplaceFilterSet(NautobotFilterSet):
+class ConfigReplaceFilterSet(NautobotFilterSet, NameSearchFilterSetMixin):
     """Inherits Base Class NautobotFilterSet."""
 
-    q = SearchFilter(
-        filter_predicates={
-            "name": {
-                "lookup_expr": "icontains",
-                "preprocessor": str,
-            },
-        },
-    )
     platform = NaturalKeyOrPKMultipleChoiceFilter(
         field_name="platform",
-        queryset=Platform.objects.all(),
+        queryset=Platform.objects.only("id", "name"),
         to_field_name="name",
         label="Platform (name or ID)",
     )
@@ -279,14 +293,14 @@ class RemediationSettingFilterSet(NautobotFilterSet):
             },
         },
     )
-    platform = django_filters.ModelMultipleChoiceFilter(
+    platform = MultiValueCharFilter(
         field_name="platform__name",
-        queryset=Platform.objects.all(),
-        to_field_name="name",
+        distinct=False,
         label="Platform Name",
     )
-    platform_id = django_filters.ModelMultipleChoiceFilter(
-        queryset=Platform.objects.all(),
+    platform_id = MultiValueUUIDFilter(
+        field_name="platform",
+        distinct=False,
         label="Platform ID",
     )
 
@@ -297,132 +311,68 @@ class RemediationSettingFilterSet(NautobotFilterSet):
         fields = ["id", "remediation_type"]
 
 
-class ConfigPlanFilterSet(NautobotFilterSet):
+class ConfigPlanFilterSet(NautobotFilterSet, DeviceScopeFilterSetMixin):
     """Inherits Base Class NautobotFilterSet."""
 
-    q = django_filters.CharFilter(
-        method="search",
-        label="Search",
-    )
-    device_id = django_filters.ModelMultipleChoiceFilter(
-        queryset=Device.objects.all(),
+    device_id = MultiValueUUIDFilter(
+        field_name="device",
+        distinct=False,
         label="Device ID",
     )
-    device = django_filters.ModelMultipleChoiceFilter(
+    device = MultiValueCharFilter(
         field_name="device__name",
-        queryset=Device.objects.all(),
-        to_field_name="name",
+        distinct=False,
         label="Device Name",
     )
-    feature_id = django_filters.ModelMultipleChoiceFilter(
-        field_name="feature__id",
-        queryset=models.ComplianceFeature.objects.all(),
-        to_field_name="id",
+    # Filters with a `method` get no generated lookup filters, so the negated lookups are declared explicitly.
+    feature_id = MultiValueUUIDFilter(
+        field_name="feature",
+        method="filter_feature",
         label="Feature ID",
     )
-    feature = django_filters.ModelMultipleChoiceFilter(
+    feature_id__n = MultiValueUUIDFilter(
+        field_name="feature",
+        method="exclude_feature",
+        label="Exclude Feature ID",
+    )
+    feature = MultiValueCharFilter(
         field_name="feature__name",
-        queryset=models.ComplianceFeature.objects.all(),
-        to_field_name="name",
+        method="filter_feature",
         label="Feature Name",
     )
-    plan_result_id = django_filters.ModelMultipleChoiceFilter(
-        queryset=JobResult.objects.filter(config_plan__isnull=False).distinct(),
-        label="Plan JobResult ID",
-        to_field_name="id",
-    )
-    tenant_group_id = TreeNodeMultipleChoiceFilter(
-        queryset=TenantGroup.objects.all(),
-        field_name="device__tenant__tenant_group",
-        to_field_name="id",
-        label="Tenant Group (ID)",
-    )
-    tenant_group = TreeNodeMultipleChoiceFilter(
-        queryset=TenantGroup.objects.all(),
-        field_name="device__tenant__tenant_group",
-        to_field_name="name",
-        label="Tenant Group (name)",
-    )
-    tenant = NaturalKeyOrPKMultipleChoiceFilter(
-        queryset=Tenant.objects.all(),
-        field_name="device__tenant",
-        to_field_name="name",
-        label="Tenant (name or ID)",
-    )
-    manufacturer = NaturalKeyOrPKMultipleChoiceFilter(
-        field_name="device__device_type__manufacturer",
-        queryset=Manufacturer.objects.all(),
-        to_field_name="name",
-        label="Manufacturer (name or ID)",
-    )
-    platform = NaturalKeyOrPKMultipleChoiceFilter(
-        field_name="device__platform",
-        queryset=Platform.objects.all(),
-        to_field_name="name",
-        label="Platform (name or ID)",
-    )
-    location_id = TreeNodeMultipleChoiceFilter(
-        # Not limiting to content_type=dcim.device to allow parent locations to be included
-        # i.e. include all Sites in a Region, even though Region can't be assigned to a Device
-        queryset=Location.objects.all(),
-        field_name="device__location",
-        to_field_name="id",
-        label="Location (ID)",
+    feature__n = MultiValueCharFilter(
+        field_name="feature__name",
+        method="exclude_feature",
+        label="Exclude Feature Name",
     )
-    location = TreeNodeMultipleChoiceFilter(
-        # Not limiting to content_type=dcim.device to allow parent locations to be included
-        # i.e. include all sites in a Region, even though Region can't be assigned to a Device
-        queryset=Location.objects.all(),
-        field_name="device__location",
-        to_field_name="name",
-        label="Location (name)",
+    plan_result_id = MultiValueUUIDFilter(
+        field_name="plan_result",
+        distinct=False,
+        label="Plan JobResult ID",
     )
-    deploy_result_id = django_filters.ModelMultipleChoiceFilter(
-        queryset=JobResult.objects.filter(config_plan__isnull=False).distinct(),
+    deploy_result_id = MultiValueUUIDFilter(
+        field_name="deploy_result",
+        distinct=False,
         label="Deploy JobResult ID",
-        to_field_name="id",
     )
     change_control_id = django_filters.CharFilter(
         field_name="change_control_id",
         lookup_expr="exact",
     )
-    rack_group_id = TreeNodeMultipleChoiceFilter(
-        queryset=RackGroup.objects.all(),
-        field_name="device__rack__rack_group",
-        to_field_name="id",
-        label="Rack group (ID)",
-    )
-    rack_group = TreeNodeMultipleChoiceFilter(
-        queryset=RackGroup.objects.all(),
-        field_name="device__rack__rack_group",
-        to_field_name="name",
-        label="Rack group (name)",
-    )
-    rack = NaturalKeyOrPKMultipleChoiceFilter(
-        field_name="device__rack",
-        queryset=Rack.objects.all(),
-        to_field_name="name",
-        label="Rack (name or ID)",
-    )
-    role = NaturalKeyOrPKMultipleChoiceFilter(
-        field_name="device__role",
-        queryset=Role.objects.filter(content_types__model="device"),
-        to_field_name="name",
-        label="Role (name or ID)",
-    )
-    status_id = django_filters.ModelMultipleChoiceFilter(
-        # field_name="status__id",
-        queryset=Status.objects.all(),
+    status_id = MultiValueUUIDFilter(
+        field_name="status",
+        distinct=False,
         label="Status ID",
     )
-    status = django_filters.ModelMultipleChoiceFilter(
+    status = MultiValueCharFilter(
         field_name="status__name",
-        queryset=Status.objects.all(),
-        to_field_name="name",
+        distinct=False,
         label="Status",
     )
     # tags = TagFilter()
 
+    # SearchFilter compiles its predicates once at declaration time. Keep both lookups in the single OR'd
+    # predicate instead of a `union()`, as a combined queryset can no longer be narrowed by the other filters.
     q = SearchFilter(
         filter_predicates={
             "device__name": {
@@ -436,6 +386,16 @@ class ConfigPlanFilterSet(NautobotFilterSet):
         },
     )
 
+    @staticmethod
+    def filter_feature(queryset, name, value):
+        """Filter on the feature many-to-many through a subquery, so matches need no `distinct()`."""
+        return queryset.filter(pk__in=models.ConfigPlan.objects.filter(**{f"{name}__in": value}).values("pk"))
+
+    @staticmethod
+    def exclude_feature(queryset, name, value):
+        """Exclude on the feature many-to-many through the same subquery as `filter_feature`."""
+        return queryset.exclude(pk__in=models.ConfigPlan.objects.filter(**{f"{name}__in": value}).values("pk"))
+
     class Meta:
         """Boilerplate filter Meta data for Config Plan."""
 
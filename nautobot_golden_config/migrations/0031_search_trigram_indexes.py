@@ -0,0 +1,52 @@
+import logging
+
+from django.db import DatabaseError, migrations, transaction
+
+LOGGER = logging.getLogger(__name__)
+
+# Columns searched with `icontains` by the `q` filters. Django renders `icontains` on PostgreSQL as
+# `UPPER("column"::text) LIKE UPPER(...)`, so the index is built on that same expression.
+TRIGRAM_INDEXES = [
+    ("nautobot_gc_compliancefeature_name_trgm", "nautobot_golden_config_compliancefeature", "name"),
+    ("nautobot_gc_configremove_name_trgm", "nautobot_golden_config_configremove", "name"),
+    ("nautobot_gc_configreplace_name_trgm", "nautobot_golden_config_configreplace", "name"),
+    ("nautobot_gc_configplan_change_control_id_trgm", "nautobot_golden_config_configplan", "change_control_id"),
+]
+
+
+def create_trigram_indexes(apps, schema_editor):
+    """Enable pg_trgm and index the searched columns, PostgreSQL only."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    try:
+        with transaction.atomic(using=schema_editor.connection.alias):
+            schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    except DatabaseError as error:
+        LOGGER.warning("Unable to enable the pg_trgm extension, skipping search indexes: %s", error)
+        return
+
+    for index_name, table, column in TRIGRAM_INDEXES:
+        schema_editor.execute(
+            f"CREATE INDEX IF NOT EXISTS {schema_editor.quote_name(index_name)} ON {schema_editor.quote_name(table)} "
+            f"USING gin (UPPER({schema_editor.quote_name(column)}::text) gin_trgm_ops)"
+        )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    """Remove the trigram indexes, the pg_trgm extension is left in place."""
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    for index_name, _, _ in TRIGRAM_INDEXES:
+        schema_editor.execute(f"DROP INDEX IF EXISTS {schema_editor.quote_name(index_name)}")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_golden_config", "0030_alter_goldenconfig_device"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
@@ -0,0 +1,14 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_golden_config", "0031_search_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="configcompliance",
+            index=models.Index(fields=["rule", "compliance_int"], name="nautobot_gc_cc_rule_comp_idx"),
+        ),
+    ]
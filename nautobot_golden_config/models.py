@@ -1,7 +1,8 @@
 """Django Models for tracking the configuration compliance per feature and device."""
 
-import json
 import logging
+from itertools import chain
+from types import MappingProxyType
 
 from deepdiff import DeepDiff
 from django.core.exceptions import ValidationError
@@ -41,12 +42,52 @@ CUSTOM_FUNCTIONS = {
 
 
 def _is_jsonable(val):
-    """Check is value can be converted to json."""
-    try:
-        json.dumps(val)
-        return True
-    except (TypeError, OverflowError):
-        return False
+    """Check is value can be converted to json, by walking its types instead of serializing it."""
+    # Like json's `check_circular`, only a container repeating on the path from the root is a cycle to reject, the
+    # same container may still be shared between branches.
+    on_path = set()
+    stack = [(val, False)]
+    while stack:
+        item, leaving = stack.pop()
+        if leaving:
+            on_path.discard(id(item))
+            continue
+        if item is None or isinstance(item, (str, int, float)):
+            continue
+        if id(item) in on_path:
+            return False
+        if isinstance(item, dict):
+            if not all(key is None or isinstance(key, (str, int, float)) for key in item):
+                return False
+            children = item.values()
+        elif isinstance(item, (list, tuple)):
+            children = item
+        else:
+            return False
+        on_path.add(id(item))
+        stack.append((item, True))
+        stack.extend((child, False) for child in children)
+    return True
+
+
+def _is_identical(actual, intended):
+    """Check two json values are equal with the same types throughout, so DeepDiff would find no difference."""
+    stack = [(actual, intended)]
+    while stack:
+        first, second = stack.pop()
+        if type(first) is not type(second):
+            return False
+        if isinstance(first, dict):
+            if first.keys() != second.keys():
+                return False
+            stack.extend((first[key], second[key]) for key in first)
+        elif isinstance(first, (list, tuple)):
+            if len(first) != len(second):
+                return False
+            stack.extend(zip(first, second))
+        elif first != second:
+            return False
+    return True
 
 
 def _null_to_empty(val):
@@ -58,14 +99,14 @@ def _null_to_empty(val):
 
 def _get_cli_compliance(obj):
     """This function performs the actual compliance for cli configuration."""
+    rule = obj.rule
     feature = {
-        "ordered": obj.rule.config_ordered,
-        "name": obj.rule,
+        "ordered": rule.config_ordered,
+        "name": rule,
+        "section": rule.match_config_lines,
     }
-    feature.update({"section": obj.rule.match_config.splitlines()})
-    value = feature_compliance(
-        feature, obj.actual, obj.intended, obj.device.platform.network_driver_mappings.get("netutils_parser")
-    )
+    netutils_parser = obj.device.platform.network_driver_mappings.get("netutils_parser")
+    value = feature_compliance(feature, obj.actual, obj.intended, netutils_parser)
     compliance = value["compliant"]
     if compliance:
         compliance_int = 1
@@ -87,15 +128,21 @@ def _get_cli_compliance(obj):
 def _get_json_compliance(obj):
     """This function performs the actual compliance for json serializable data."""
 
-    def _normalize_diff(diff, path_to_diff):
+    def _normalize_diff(diff, path_to_diff, changed):
         """Normalizes the diff to a list of keys and list indexes that have changed."""
-        dictionary_items = list(diff.get(f"dictionary_item_{path_to_diff}", []))
-        list_items = list(diff.get(f"iterable_item_{path_to_diff}", {}).keys())
-        values_changed = list(diff.get("values_changed", {}).keys())
-        type_changes = list(diff.get("type_changes", {}).keys())
-        return dictionary_items + list_items + values_changed + type_changes
+        return list(
+            chain(
+                diff.get(f"dictionary_item_{path_to_diff}", ()),
+                diff.get(f"iterable_item_{path_to_diff}", {}).keys(),
+                changed,
+            )
+        )
 
-    diff = DeepDiff(obj.actual, obj.intended, ignore_order=obj.ordered, report_repetition=True)
+    if _is_identical(obj.actual, obj.intended):
+        diff = None
+    else:
+        # The cache is only used when ignoring order, where it saves DeepDiff from re-hashing the same nested items.
+        diff = DeepDiff(obj.actual, obj.intended, ignore_order=obj.ordered, report_repetition=True, cache_size=5000)
     if not diff:
         compliance_int = 1
         compliance = True
@@ -106,8 +153,10 @@ def _get_json_compliance(obj):
         compliance_int = 0
         compliance = False
         ordered = False
-        missing = _null_to_empty(_normalize_diff(diff, "added"))
-        extra = _null_to_empty(_normalize_diff(diff, "removed"))
+        # Changed values and types are reported on both sides.
+        changed = list(chain(diff.get("values_changed", {}).keys(), diff.get("type_changes", {}).keys()))
+        missing = _null_to_empty(_normalize_diff(diff, "added", changed))
+        extra = _null_to_empty(_normalize_diff(diff, "removed", changed))
 
     return {
         "compliance": compliance,
@@ -137,14 +186,14 @@ def _verify_get_custom_compliance_data(compliance_details):
 
 def _get_hierconfig_remediation(obj):
     """Returns the remediating config."""
-    hierconfig_os = obj.device.platform.network_driver_mappings["hier_config"]
+    platform = obj.device.platform
+    hierconfig_os = platform.network_driver_mappings["hier_config"]
     if not hierconfig_os:
-        raise ValidationError(f"platform {obj.network_driver} is not supported by hierconfig.")
+        raise ValidationError(f"platform {platform.network_driver} is not supported by hierconfig.")
 
-    try:
-        remediation_setting_obj = RemediationSetting.objects.get(platform=obj.rule.platform)
-    except Exception as err:  # pylint: disable=broad-except:
-        raise ValidationError(f"Platform {obj.network_driver} has no Remediation Settings defined.") from err
+    remediation_setting_obj = obj.rule.remediation_setting
+    if not remediation_setting_obj:
+        raise ValidationError(f"Platform {platform.network_driver} has no Remediation Settings defined.")
 
     remediation_options = remediation_setting_obj.remediation_options
 
@@ -154,7 +203,7 @@ def _get_hierconfig_remediation(obj):
             hc_kwargs.update(hconfig_options=remediation_options)
         host = HierConfigHost(**hc_kwargs)
 
-    except Exception as err:  # pylint: disable=broad-except:
+    except (AttributeError, KeyError, TypeError, ValueError) as err:
         raise Exception(  # pylint: disable=broad-exception-raised
             f"Cannot instantiate HierConfig on {obj.device.name}, check Device, Platform and Hier Options."
         ) from err
@@ -186,6 +235,9 @@ for custom_function, custom_type in CUSTOM_FUNCTIONS.items():
             )
             raise Exception(msg).with_traceback(error.__traceback__)
 
+# Nothing is registered after import, so hand out a read-only view of the mapping.
+FUNC_MAPPER = MappingProxyType(FUNC_MAPPER)
+
 
 @extras_features(
     "custom_fields",
@@ -261,10 +313,22 @@ class ComplianceRule(PrimaryModel):  # pylint: disable=too-many-ancestors
         default=False, help_text="Whether this Compliance Rule is proceeded as custom."
     )
 
+    @property
+    def match_config_lines(self):
+        """Returns `match_config` split into lines, cached on the instance until `match_config` changes."""
+        cached = self.__dict__.get("_match_config_lines")
+        if cached is None or cached[0] != self.match_config:
+            cached = (self.match_config, self.match_config.splitlines() if self.match_config else [])
+            self.__dict__["_match_config_lines"] = cached
+        return cached[1]
+
     @property
     def remediation_setting(self):
-        """Returns remediation settings for a particular platform."""
-        return RemediationSetting.objects.filter(platform=self.platform).first()
+        """Returns remediation settings for a particular platform, cached on the platform instance."""
+        try:
+            return self.platform.remediation_settings
+        except RemediationSetting.DoesNotExist:
+            return None
 
     class Meta:
         """Meta information for ComplianceRule model."""
@@ -316,12 +380,16 @@ class ConfigCompliance(PrimaryModel):  # pylint: disable=too-many-ancestors
         """Remove actual and intended configuration from changelog."""
         if not object_data_exclude:
             object_data_exclude = ["actual", "intended"]
+        # The v2 data comes from the REST API serializer, which has no exclude option of its own.
+        object_data_v2 = serialize_object_v2(self)
+        for field in object_data_exclude:
+            object_data_v2.pop(field, None)
         return ObjectChange(
             changed_object=self,
             object_repr=str(self),
             action=action,
             object_data=serialize_object(self, extra=object_data_extra, exclude=object_data_exclude),
-            object_data_v2=serialize_object_v2(self),
+            object_data_v2=object_data_v2,
             related_object=related_object,
         )
 
@@ -330,6 +398,8 @@ class ConfigCompliance(PrimaryModel):  # pylint: disable=too-many-ancestors
 
         ordering = ["device", "rule"]
         unique_together = ("device", "rule")
+        # `unique_together` already indexes lookups by device and rule, this serves the per-rule compliance rollups.
+        indexes = [models.Index(fields=["rule", "compliance_int"], name="nautobot_gc_cc_rule_comp_idx")]
 
     def __str__(self):
         """String representation of a the compliance."""
@@ -337,15 +407,17 @@ class ConfigCompliance(PrimaryModel):  # pylint: disable=too-many-ancestors
 
     def compliance_on_save(self):
         """The actual configuration compliance happens here, but the details for actual compliance job would be found in FUNC_MAPPER."""
-        if self.rule.custom_compliance:
-            if not FUNC_MAPPER.get("custom"):
+        rule = self.rule
+        if rule.custom_compliance:
+            custom_compliance = FUNC_MAPPER.get("custom")
+            if not custom_compliance:
                 raise ValidationError(
                     "Custom type provided, but no `get_custom_compliance` config set, please contact system admin."
                 )
-            compliance_details = FUNC_MAPPER["custom"](obj=self)
+            compliance_details = custom_compliance(obj=self)
             _verify_get_custom_compliance_data(compliance_details)
         else:
-            compliance_details = FUNC_MAPPER[self.rule.config_type](obj=self)
+            compliance_details = FUNC_MAPPER[rule.config_type](obj=self)
 
         self.compliance = compliance_details["compliance"]
         self.compliance_int = compliance_details["compliance_int"]
@@ -359,15 +431,17 @@ class ConfigCompliance(PrimaryModel):  # pylint: disable=too-many-ancestors
             self.remediation = ""
             return
 
-        if not self.rule.config_remediation:
+        rule = self.rule
+        if not rule.config_remediation:
             self.remediation = ""
             return
 
-        if not self.rule.remediation_setting:
+        remediation_setting = rule.remediation_setting
+        if not remediation_setting:
             self.remediation = ""
             return
 
-        remediation_config = FUNC_MAPPER[self.rule.remediation_setting.remediation_type](obj=self)
+        remediation_config = FUNC_MAPPER[remediation_setting.remediation_type](obj=self)
         self.remediation = remediation_config
 
     def save(self, *args, **kwargs):
@@ -415,12 +489,16 @@ class GoldenConfig(PrimaryModel):  # pylint: disable=too-many-ancestors
         """Remove actual and intended configuration from changelog."""
         if not object_data_exclude:
             object_data_exclude = ["backup_config", "intended_config", "compliance_config"]
+        # The v2 data comes from the REST API serializer, which has no exclude option of its own.
+        object_data_v2 = serialize_object_v2(self)
+        for field in object_data_exclude:
+            object_data_v2.pop(field, None)
         return ObjectChange(
             changed_object=self,
             object_repr=str(self),
             action=action,
             object_data=serialize_object(self, extra=object_data_extra, exclude=object_data_exclude),
-            object_data_v2=serialize_object_v2(self),
+            object_data_v2=object_data_v2,
             related_object=related_object,
         )
 
@@ -99,14 +99,14 @@ def config_backup(job_result, log_level, data):
 
     # Build a dictionary, with keys of platform.network_driver, and the regex line in it for the netutils func.
     remove_regex_dict = {}
-    for regex in ConfigRemove.objects.all():
+    for regex in ConfigRemove.objects.select_related("platform"):
         if not remove_regex_dict.get(regex.platform.network_driver):
             remove_regex_dict[regex.platform.network_driver] = []
         remove_regex_dict[regex.platform.network_driver].append({"regex": regex.regex})
 
     # Build a dictionary, with keys of platform.network_driver, and the regex and replace keys for the netutils func.
     replace_regex_dict = {}
-    for regex in ConfigReplace.objects.all():
+    for regex in ConfigReplace.objects.select_related("platform"):
         if not replace_regex_dict.get(regex.platform.network_driver):
             replace_regex_dict[regex.platform.network_driver] = []
         replace_regex_dict[regex.platform.network_driver].append({"replace": regex.replace, "regex": regex.regex})
@@ -36,13 +36,13 @@ def get_rules():
     """A serializer of sorts to return rule mappings as a dictionary."""
     # TODO: Future: Review if creating a proper serializer is the way to go.
     rules = defaultdict(list)
-    for compliance_rule in ComplianceRule.objects.all():
+    for compliance_rule in ComplianceRule.objects.select_related("platform"):
         platform = str(compliance_rule.platform.network_driver)
         rules[platform].append(
             {
                 "ordered": compliance_rule.config_ordered,
                 "obj": compliance_rule,
-                "section": compliance_rule.match_config.splitlines(),
+                "section": compliance_rule.match_config_lines,
             }
         )
     return rules
@@ -65,7 +65,7 @@ def get_config_element(rule, config, obj, logger):
             raise NornirNautobotException(error_msg)
 
         if rule["obj"].match_config:
-            config_element = {k: config_json.get(k) for k in rule["obj"].match_config.splitlines() if k in config_json}
+            config_element = {k: config_json.get(k) for k in rule["obj"].match_config_lines if k in config_json}
         else:
             config_element = config_json
 
@@ -155,10 +155,14 @@ def run_compliance(  # pylint: disable=too-many-arguments,too-many-locals
         _intended = get_config_element(rule, intended_cfg, obj, logger)
 
         # using update_or_create() method to conveniently update actual obj or create new one.
+        # The device and rule are passed in the defaults as well, so that an existing row reuses these already
+        # loaded instances on save, instead of fetching the rule, device and their platforms again.
         ConfigCompliance.objects.update_or_create(
             device=obj,
             rule=rule["obj"],
             defaults={
+                "device": obj,
+                "rule": rule["obj"],
                 "actual": _actual,
                 "intended": _intended,
                 "missing": "",
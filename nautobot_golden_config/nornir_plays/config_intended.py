@@ -2,9 +2,8 @@
 # pylint: disable=relative-beyond-top-level
 import logging
 import os
-from datetime import datetime
 
-from django.utils.timezone import make_aware
+from django.utils import timezone
 
 from nautobot_plugin_nornir.constants import NORNIR_SETTINGS
 from nautobot_plugin_nornir.plugins.inventory.nautobot_orm import NautobotORMInventory
@@ -55,11 +54,8 @@ def run_template(  # pylint: disable=too-many-arguments,too-many-locals
     obj = task.host.data["obj"]
     settings = device_to_settings_map[obj.id]
 
-    intended_obj = GoldenConfig.objects.filter(device=obj).first()
-    if not intended_obj:
-        intended_obj = GoldenConfig.objects.create(device=obj)
-    intended_obj.intended_last_attempt_date = task.host.defaults.data["now"]
-    intended_obj.save()
+    # The entry was created, and its attempt date recorded, for all devices before the tasks were started.
+    intended_obj = GoldenConfig.objects.get(device=obj)
 
     intended_directory = settings.intended_repository.filesystem_path
     intended_path_template_obj = render_jinja_template(obj, logger, settings.intended_path_template)
@@ -88,8 +84,13 @@ def run_template(  # pylint: disable=too-many-arguments,too-many-locals
         **dispatch_params("generate_config", obj.platform.network_driver, logger),
     )[1].result["config"]
     intended_obj.intended_last_success_date = task.host.defaults.data["now"]
-    intended_obj.intended_config = generated_config
-    intended_obj.save()
+    # Only write what this job owns, leaving the backup and compliance columns of the row alone. The stored config
+    # was loaded with the row, so an unchanged config is not sent back to the database.
+    update_fields = ["intended_last_success_date", "last_updated"]
+    if intended_obj.intended_config != generated_config:
+        intended_obj.intended_config = generated_config
+        update_fields.append("intended_config")
+    intended_obj.save(update_fields=update_fields)
 
     logger.info("Successfully generated the intended configuration.", extra={"object": obj})
 
@@ -108,7 +109,7 @@ def config_intended(job_result, log_level, data, job_class_instance):
     Returns:
         None: Intended configuration files are written to filesystem.
     """
-    now = make_aware(datetime.now())
+    now = timezone.now()
     logger = NornirLogger(job_result, log_level)
 
     try:
@@ -124,6 +125,15 @@ def config_intended(job_result, log_level, data, job_class_instance):
     for settings in set(device_to_settings_map.values()):
         verify_settings(logger, settings, ["jinja_path_template", "intended_path_template", "sot_agg_query"])
 
+    # Create the missing GoldenConfig entries and record the attempt in bulk, rather than with per device queries.
+    # Neither call sends model signals, so no per device ObjectChange is recorded for this bookkeeping.
+    GoldenConfig.objects.bulk_create(
+        [GoldenConfig(device_id=pk) for pk in qs.filter(goldenconfig__isnull=True).values_list("pk", flat=True)],
+        ignore_conflicts=True,
+    )
+    # `update()` does not apply `auto_now`, so `last_updated` is set alongside, as `save()` would have done.
+    GoldenConfig.objects.filter(device__in=qs).update(intended_last_attempt_date=now, last_updated=now)
+
     # Retrieve filters from the Django jinja template engine
     jinja_env = get_django_env()
 
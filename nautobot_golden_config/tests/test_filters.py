@@ -1,10 +1,13 @@
 """Unit tests for nautobot_golden_config models."""
 
+import uuid
+
 from django.test import TestCase
 from nautobot.dcim.models import Device, Platform
 from nautobot.extras.models import Status, Tag
 from nautobot.core.testing import FilterTestCases
 from nautobot_golden_config import filters, models
+from nautobot_golden_config.choices import RemediationTypeChoice
 
 from .conftest import create_device_data, create_feature_rule_cli, create_feature_rule_json, create_job_result
 
@@ -219,6 +222,46 @@ class ConfigComplianceModelTestCase(TestCase):  # pylint: disable=too-many-publi
         self.assertEqual(self.filterset(params, self.queryset).qs.count(), 4)
 
 
+class ConfigComplianceFeatureFilterTestCase(TestCase):
+    """Test filtering ConfigCompliance by feature, which GoldenConfig does not share."""
+
+    queryset = models.ConfigCompliance.objects.all()
+    filterset = filters.ConfigComplianceFilterSet
+
+    def setUp(self):
+        """Set up base objects."""
+        create_device_data()
+        dev01 = Device.objects.get(name="Device 1")
+        dev02 = Device.objects.get(name="Device 2")
+        self.rule1 = create_feature_rule_json(dev01, feature="foo")
+        rule2 = create_feature_rule_json(dev02, feature="bar")
+        for device, rule in [(dev01, self.rule1), (dev02, rule2)]:
+            models.ConfigCompliance.objects.create(
+                device=device,
+                rule=rule,
+                actual={"foo": {"bar-1": "baz"}},
+                intended={"foo": {"bar-1": "baz"}},
+            )
+
+    def test_feature(self):
+        """Test filtering by Feature slug."""
+        params = {"feature": [self.rule1.feature.slug]}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 1)
+
+    def test_feature_unknown(self):
+        """Test a Feature slug that matches nothing returns no results rather than a validation error."""
+        filterset = self.filterset({"feature": ["does-not-exist"]}, self.queryset)
+        self.assertTrue(filterset.is_valid())
+        self.assertEqual(filterset.qs.count(), 0)
+
+    def test_feature_id_unknown(self):
+        """Test a well-formed Feature ID that matches nothing returns no results, and a malformed one is rejected."""
+        filterset = self.filterset({"feature_id": [uuid.uuid4()]}, self.queryset)
+        self.assertTrue(filterset.is_valid())
+        self.assertEqual(filterset.qs.count(), 0)
+        self.assertFalse(self.filterset({"feature_id": ["not-a-uuid"]}, self.queryset).is_valid())
+
+
 class GoldenConfigModelTestCase(ConfigComplianceModelTestCase):
     """Test filtering operations for GoldenConfig Model."""
 
@@ -381,6 +424,44 @@ class ComplianceFeatureModelTestCase(TestCase):
         self.assertEqual(self.filterset(params, self.queryset).qs.count(), 1)
 
 
+class RemediationSettingFilterTestCase(TestCase):
+    """Test filtering operations for RemediationSetting Model."""
+
+    queryset = models.RemediationSetting.objects.all()
+    filterset = filters.RemediationSettingFilterSet
+
+    def setUp(self):
+        """Setup Object."""
+        self.platform1 = Platform.objects.create(name="Platform 1")
+        platform2 = Platform.objects.create(name="Platform 2")
+        models.RemediationSetting.objects.create(
+            platform=self.platform1, remediation_type=RemediationTypeChoice.TYPE_HIERCONFIG
+        )
+        models.RemediationSetting.objects.create(platform=platform2, remediation_type=RemediationTypeChoice.TYPE_CUSTOM)
+
+    def test_full(self):
+        """Test without filtering to ensure all have been added."""
+        self.assertEqual(self.queryset.count(), 2)
+
+    def test_platform(self):
+        """Test filtering by Platform name."""
+        params = {"platform": [self.platform1.name]}
+        self.assertEqual(self.filterset(params, self.queryset).qs.count(), 1)
+
+    def test_platform_unknown(self):
+        """Test a Platform name that matches nothing returns no results rather than a validation error."""
+        filterset = self.filterset({"platform": ["does-not-exist"]}, self.queryset)
+        self.assertTrue(filterset.is_valid())
+        self.assertEqual(filterset.qs.count(), 0)
+
+    def test_platform_id_unknown(self):
+        """Test a well-formed Platform ID that matches nothing returns no results, and a malformed one is rejected."""
+        filterset = self.filterset({"platform_id": [uuid.uuid4()]}, self.queryset)
+        self.assertTrue(filterset.is_valid())
+        self.assertEqual(filterset.qs.count(), 0)
+        self.assertFalse(self.filterset({"platform_id": ["not-a-uuid"]}, self.queryset).is_valid())
+
+
 # pylint: disable=too-many-ancestors
 # pylint: disable=too-many-instance-attributes
 class ConfigPlanFilterTestCase(FilterTestCases.FilterTestCase):
@@ -489,6 +570,23 @@ class ConfigPlanFilterTestCase(FilterTestCases.FilterTestCase):
             filterset.qs, self.queryset.filter(device__name=self.device1.name).distinct()
         )
 
+    def test_filter_unknown_name(self):
+        """Test names that match nothing return no results rather than a validation error."""
+        for field in ["device", "feature", "status"]:
+            with self.subTest(field=field):
+                filterset = self.filterset({field: ["does-not-exist"]}, self.queryset)
+                self.assertTrue(filterset.is_valid())
+                self.assertEqual(filterset.qs.count(), 0)
+
+    def test_filter_unknown_id(self):
+        """Test well-formed IDs that match nothing return no results, while malformed IDs are still rejected."""
+        for field in ["device_id", "feature_id", "plan_result_id", "deploy_result_id", "status_id"]:
+            with self.subTest(field=field):
+                filterset = self.filterset({field: [uuid.uuid4()]}, self.queryset)
+                self.assertTrue(filterset.is_valid())
+                self.assertEqual(filterset.qs.count(), 0)
+                self.assertFalse(self.filterset({field: ["not-a-uuid"]}, self.queryset).is_valid())
+
     def test_filter_feature_id(self):
         """Test filtering by Feature ID."""
         params = {"feature_id": [self.feature1.pk]}
@@ -505,6 +603,26 @@ class ConfigPlanFilterTestCase(FilterTestCases.FilterTestCase):
             filterset.qs, self.queryset.filter(feature__name=self.feature1.name).distinct()
         )
 
+    def test_filter_feature_multiple(self):
+        """Test a plan matching several of the requested features is only returned once."""
+        for params in [
+            {"feature_id": [self.feature1.pk, self.feature3.pk]},
+            {"feature": [self.feature1.name, self.feature3.name]},
+        ]:
+            filterset = self.filterset(params, self.queryset)
+            self.assertEqual(filterset.qs.count(), 2)
+            self.assertEqual(list(filterset.qs).count(self.config_plan3), 1)
+            self.assertQuerysetEqualAndNotEmpty(
+                filterset.qs, self.queryset.filter(feature__in=[self.feature1, self.feature3]).distinct()
+            )
+
+    def test_filter_feature_exclude(self):
+        """Test excluding by Feature ID and Feature name."""
+        for params in [{"feature_id__n": [self.feature1.pk]}, {"feature__n": [self.feature1.name]}]:
+            filterset = self.filterset(params, self.queryset)
+            self.assertEqual(filterset.qs.count(), 2)
+            self.assertQuerysetEqualAndNotEmpty(filterset.qs, self.queryset.exclude(feature=self.feature1))
+
     def test_filter_change_control_id(self):
         """Test filtering by Change Control ID."""
         params = {"change_control_id": self.config_plan1.change_control_id}
@@ -1,10 +1,14 @@
 """Unit tests for nautobot_golden_config models."""
 
+import json
+from decimal import Decimal
+
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db.models.deletion import ProtectedError
-from django.test import TestCase
+from django.test import SimpleTestCase, TestCase
 from nautobot.dcim.models import Platform
+from nautobot.extras.choices import ObjectChangeActionChoices
 from nautobot.extras.models import DynamicGroup, GitRepository, GraphQLQuery, Status
 
 from nautobot_golden_config.choices import RemediationTypeChoice
@@ -15,12 +19,14 @@ from nautobot_golden_config.models import (
     ConfigReplace,
     GoldenConfigSetting,
     RemediationSetting,
+    _is_jsonable,
 )
 from nautobot_golden_config.tests.conftest import create_git_repos
 
 from .conftest import (
     create_config_compliance,
     create_device,
+    create_feature_rule_cli,
     create_feature_rule_json,
     create_job_result,
     create_saved_queries,
@@ -49,6 +55,18 @@ class ConfigComplianceModelTestCase(TestCase):
         self.assertEqual(cc_obj.missing, ["root['foo']['bar-2']"])
         self.assertEqual(cc_obj.extra, ["root['foo']['bar-1']"])
 
+    def test_config_compliance_objectchange_excludes_configs(self):
+        """Actual and intended configuration are left out of both changelog payloads."""
+        cc_obj = create_config_compliance(
+            self.device, actual={"foo": "bar"}, intended={"foo": "bar"}, compliance_rule=self.compliance_rule_json
+        )
+        object_change = cc_obj.to_objectchange(ObjectChangeActionChoices.ACTION_UPDATE)
+
+        for object_data in [object_change.object_data, object_change.object_data_v2]:
+            self.assertNotIn("actual", object_data)
+            self.assertNotIn("intended", object_data)
+            self.assertIn("compliance", object_data)
+
     def test_create_config_compliance_unique_failure(self):
         """Raises error when attempting to create duplicate."""
         ConfigCompliance.objects.create(
@@ -83,6 +101,19 @@ class ConfigComplianceModelTestCase(TestCase):
         self.assertEqual(cc_obj.missing, "")
         self.assertEqual(cc_obj.extra, "")
 
+    def test_create_config_compliance_type_change(self):
+        """Equal values of a different type are not compliant."""
+        cc_obj = ConfigCompliance.objects.create(
+            device=self.device,
+            rule=self.compliance_rule_json,
+            actual={"foo": {"bar-1": 1}},
+            intended={"foo": {"bar-1": 1.0}},
+        )
+
+        self.assertFalse(cc_obj.compliance)
+        self.assertEqual(cc_obj.missing, ["root['foo']['bar-1']"])
+        self.assertEqual(cc_obj.extra, ["root['foo']['bar-1']"])
+
     def test_config_compliance_signal_change_platform(self):
         """Make sure signal is working."""
         ConfigCompliance.objects.create(
@@ -104,6 +135,50 @@ class ConfigComplianceModelTestCase(TestCase):
         self.assertEqual(ConfigCompliance.objects.filter(device=self.device).count(), 1)
 
 
+class IsJsonableTestCase(SimpleTestCase):
+    """Test the json check on custom compliance output."""
+
+    def test_is_jsonable_matches_json_dumps(self):
+        """The type walk accepts exactly what json.dumps accepts."""
+
+        def json_dumps_succeeds(val):
+            try:
+                json.dumps(val)
+            except (TypeError, ValueError):
+                return False
+            return True
+
+        shared = ["shared"]
+        cyclic_list = []
+        cyclic_list.append(cyclic_list)
+        cyclic_dict = {}
+        cyclic_dict["nested"] = {"parent": cyclic_dict}
+        values = [
+            None,
+            True,
+            1,
+            1.5,
+            "string",
+            float("nan"),
+            [1, "a", None],
+            (1, 2),
+            {"key": {"nested": [1, 2]}},
+            {1: "int key", None: "none key", 1.5: "float key"},
+            {(1, 2): "tuple key"},
+            b"bytes",
+            {"set"},
+            Decimal("1.1"),
+            [shared, shared],
+            {"first": shared, "second": shared},
+            cyclic_list,
+            cyclic_dict,
+            [object()],
+        ]
+        for val in values:
+            with self.subTest(val=val):
+                self.assertEqual(_is_jsonable(val), json_dumps_succeeds(val))
+
+
 class GoldenConfigTestCase(TestCase):
     """Test GoldenConfig Model."""
 
@@ -111,6 +186,24 @@ class GoldenConfigTestCase(TestCase):
 class ComplianceRuleTestCase(TestCase):
     """Test ComplianceRule Model."""
 
+    def setUp(self):
+        """Set up base objects."""
+        self.device = create_device()
+        self.compliance_rule_cli = create_feature_rule_cli(self.device)
+
+    def test_match_config_lines(self):
+        """Lines are split once and refreshed when match_config changes."""
+        self.compliance_rule_cli.match_config = "aaa\nsnmp\n"
+        lines = self.compliance_rule_cli.match_config_lines
+        self.assertEqual(lines, ["aaa", "snmp"])
+        self.assertIs(self.compliance_rule_cli.match_config_lines, lines)
+
+        self.compliance_rule_cli.match_config = "ntp"
+        self.assertEqual(self.compliance_rule_cli.match_config_lines, ["ntp"])
+
+        self.compliance_rule_cli.match_config = ""
+        self.assertEqual(self.compliance_rule_cli.match_config_lines, [])
+
 
 class GoldenConfigSettingModelTestCase(TestCase):
     """Test GoldenConfigSetting Model."""
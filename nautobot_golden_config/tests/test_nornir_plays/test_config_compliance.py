@@ -13,13 +13,13 @@ class ConfigComplianceTest(unittest.TestCase):
     @patch("nautobot_golden_config.nornir_plays.config_compliance.ComplianceRule", autospec=True)
     def test_get_rules(self, mock_compliance_rule):
         """Test proper return when Features are returned."""
-        features = {"config_ordered": "test_ordered", "match_config": "aaa\nsnmp\n"}
+        features = {"config_ordered": "test_ordered", "match_config_lines": ["aaa", "snmp"]}
         mock_obj = Mock(**features)
         mock_obj.name = "test_name"
         mock_obj.platform = Mock(network_driver="test_driver")
-        mock_compliance_rule.objects.all.return_value = [mock_obj]
+        mock_compliance_rule.objects.select_related.return_value = [mock_obj]
         features = get_rules()
-        mock_compliance_rule.objects.all.assert_called_once()
+        mock_compliance_rule.objects.select_related.assert_called_once_with("platform")
         self.assertEqual(
             features, {"test_driver": [{"obj": mock_obj, "ordered": "test_ordered", "section": ["aaa", "snmp"]}]}
         )
@@ -31,6 +31,7 @@ class ConfigComplianceTest(unittest.TestCase):
         mock_obj.platform = Mock(network_driver="test_driver")
         mock_rule = MagicMock(name="ComplianceRule")
         mock_rule["obj"].match_config = "key1"
+        mock_rule["obj"].match_config_lines = ["key1"]
         mock_rule["obj"].config_ordered = True
         mock_rule["obj"].config_type = ComplianceRuleConfigTypeChoice.TYPE_JSON
         return_config = json.dumps(get_config_element(mock_rule, mock_config, mock_obj, None))
@@ -0,0 +1,105 @@
+"""Unit tests for nautobot_golden_config nornir intended."""
+
+import logging
+from datetime import timedelta
+from unittest.mock import MagicMock, patch
+
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from nautobot.dcim.models import Device
+
+from nautobot_golden_config.models import GoldenConfig
+from nautobot_golden_config.nornir_plays.config_intended import config_intended, run_template
+from nautobot_golden_config.tests.conftest import create_device
+
+
+class ConfigIntendedTest(TestCase):
+    """Test Nornir Intended Play."""
+
+    def setUp(self):
+        """Create devices, only some of which already have a GoldenConfig entry."""
+        self.now = timezone.now()
+        self.stale = self.now - timedelta(days=1)
+        self.existing_device = create_device(name="existing_device")
+        self.missing_device = create_device(name="missing_device")
+        GoldenConfig.objects.create(
+            device=self.existing_device,
+            intended_config="hostname existing_device",
+            intended_last_attempt_date=self.stale,
+        )
+        GoldenConfig.objects.filter(device=self.existing_device).update(last_updated=self.stale)
+
+    @patch("nautobot_golden_config.nornir_plays.config_intended.InitNornir")
+    @patch("nautobot_golden_config.nornir_plays.config_intended.get_django_env")
+    @patch("nautobot_golden_config.nornir_plays.config_intended.get_device_to_settings_map", return_value={})
+    @patch("nautobot_golden_config.nornir_plays.config_intended.get_job_filter")
+    @patch("nautobot_golden_config.nornir_plays.config_intended.timezone")
+    def test_config_intended_prepares_golden_config(self, mock_timezone, mock_job_filter, *_):
+        """Test every device ends up with exactly one GoldenConfig entry, with the attempt recorded."""
+        mock_timezone.now.return_value = self.now
+        mock_job_filter.return_value = Device.objects.filter(pk__in=[self.existing_device.pk, self.missing_device.pk])
+        config_intended(MagicMock(), logging.INFO, {}, MagicMock())
+
+        for device in [self.existing_device, self.missing_device]:
+            with self.subTest(device=device.name):
+                self.assertEqual(GoldenConfig.objects.filter(device=device).count(), 1)
+                golden_config = GoldenConfig.objects.get(device=device)
+                self.assertEqual(golden_config.intended_last_attempt_date, self.now)
+                self.assertEqual(golden_config.last_updated, self.now)
+        # The existing entry is only updated, not replaced.
+        self.assertEqual(
+            GoldenConfig.objects.get(device=self.existing_device).intended_config, "hostname existing_device"
+        )
+
+
+@patch.dict("nautobot_golden_config.utilities.db_management.RUNNER_SETTINGS", {}, clear=True)
+@patch("nautobot_golden_config.nornir_plays.config_intended.dispatch_params", return_value={})
+@patch("nautobot_golden_config.nornir_plays.config_intended.graph_ql_query", return_value=(200, {}))
+@patch("nautobot_golden_config.nornir_plays.config_intended.render_jinja_template", return_value="device.cfg")
+class RunTemplateTest(TestCase):
+    """Test the per device Nornir task of the Intended Play."""
+
+    def setUp(self):
+        """Create a device with an existing GoldenConfig entry and a Nornir task for it."""
+        self.now = timezone.now()
+        self.stale = self.now - timedelta(days=1)
+        self.device = create_device(name="intended_device")
+        GoldenConfig.objects.create(
+            device=self.device,
+            intended_config="hostname intended_device",
+            intended_last_success_date=self.stale,
+        )
+        self.task = MagicMock()
+        self.task.host.data = {"obj": self.device}
+        self.task.host.defaults.data = {"now": self.now}
+        settings = MagicMock()
+        settings.intended_repository.filesystem_path = "/tmp/intended"
+        settings.jinja_repository.filesystem_path = "/tmp/jinja"
+        self.device_to_settings_map = {self.device.id: settings}
+
+    def _run_template(self, generated_config):
+        """Run the task with the dispatcher generating `generated_config`, returning the UPDATE queries issued."""
+        self.task.run.return_value = [MagicMock(), MagicMock(result={"config": generated_config})]
+        with CaptureQueriesContext(connection) as queries:
+            run_template(self.task, MagicMock(), self.device_to_settings_map, MagicMock(), MagicMock())
+        return [query["sql"] for query in queries.captured_queries if query["sql"].startswith("UPDATE")]
+
+    def test_run_template_unchanged_config(self, *_):
+        """Test an unchanged intended config is not written back, while the success date still is."""
+        updates = self._run_template("hostname intended_device")
+        self.assertEqual(len(updates), 1)
+        self.assertNotIn("intended_config", updates[0])
+        golden_config = GoldenConfig.objects.get(device=self.device)
+        self.assertEqual(golden_config.intended_config, "hostname intended_device")
+        self.assertEqual(golden_config.intended_last_success_date, self.now)
+
+    def test_run_template_changed_config(self, *_):
+        """Test a changed intended config is saved along with the success date."""
+        updates = self._run_template("hostname intended_device\nntp server 10.0.0.1")
+        self.assertEqual(len(updates), 1)
+        self.assertIn("intended_config", updates[0])
+        golden_config = GoldenConfig.objects.get(device=self.device)
+        self.assertEqual(golden_config.intended_config, "hostname intended_device\nntp server 10.0.0.1")
+        self.assertEqual(golden_config.intended_last_success_date, self.now)
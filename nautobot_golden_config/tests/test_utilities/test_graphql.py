@@ -1,10 +1,14 @@
 """Unit tests for nautobot_golden_config utilities graphql."""
 
+import uuid
 from unittest.mock import patch
 from unittest import skip
 
+from django.contrib.auth import get_user_model
+from django.test.client import RequestFactory
 from nautobot.core.testing import TestCase
 from nautobot.dcim.models import Device
+from nautobot_golden_config.tests.conftest import create_device
 from nautobot_golden_config.utilities.graphql import graph_ql_query
 
 
@@ -25,3 +29,31 @@ class GraphQLTest(TestCase):
         self.assertEqual(result[0], 400)
         self.assertTrue(result[1]["error"])
         self.assertRegex(result[1].get("error"), r"Syntax Error GraphQL.*")
+
+
+class GraphQLQueryExecutionTest(TestCase):
+    """Test graph_ql_query against the GraphQL schema."""
+
+    def setUp(self):
+        """Set up a device and a request to execute queries with."""
+        self.device = create_device(name="graphql_device")
+        self.request = RequestFactory().request(SERVER_NAME="WebRequestContext")
+        self.request.id = uuid.uuid4()
+        self.request.user = get_user_model().objects.create(username="Super User", is_active=True, is_superuser=True)
+
+    @patch.dict("nautobot_golden_config.utilities.graphql.PLUGIN_CFG", {"sot_agg_transposer": None})
+    def test_graph_ql_query_invalid_field(self):
+        """Ensure a query that parses but fails validation returns the validation errors."""
+        query = "query ($device_id: ID!) { device(id: $device_id) { not_a_field } }"
+        status, data = graph_ql_query(self.request, self.device, query)
+        self.assertEqual(status, 400)
+        self.assertEqual(list(data), ["errors"])
+        self.assertIn("not_a_field", data["errors"][0]["message"])
+
+    @patch.dict("nautobot_golden_config.utilities.graphql.PLUGIN_CFG", {"sot_agg_transposer": None})
+    def test_graph_ql_query_repeated(self):
+        """Ensure a valid query returns the same data when it is executed again from the cached document."""
+        query = "query ($device_id: ID!) { device(id: $device_id) { name platform { network_driver } } }"
+        expected = (200, {"name": "graphql_device", "platform": {"network_driver": "cisco_ios"}})
+        self.assertEqual(graph_ql_query(self.request, self.device, query), expected)
+        self.assertEqual(graph_ql_query(self.request, self.device, query), expected)
@@ -1,11 +1,16 @@
 """Unit tests for nautobot_golden_config utilities helpers."""
 
 import logging
+import os
+import tempfile
 from unittest.mock import MagicMock, patch
 
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.template import engines
+from jinja2 import FileSystemBytecodeCache
 from jinja2 import exceptions as jinja_errors
 from nautobot.dcim.models import Device, Platform, Location, LocationType
 from nautobot.extras.models import DynamicGroup, GitRepository, GraphQLQuery, Status, Tag
@@ -14,6 +19,7 @@ from nautobot_golden_config.models import GoldenConfigSetting
 from nautobot_golden_config.tests.conftest import create_device, create_helper_repo, create_orphan_device
 from nautobot_golden_config.utilities.helper import (
     get_device_to_settings_map,
+    get_django_env,
     get_job_filter,
     null_to_empty,
     render_jinja_template,
@@ -138,6 +144,7 @@ class HelpersTest(TestCase):  # pylint: disable=too-many-instance-attributes
         mock_device.platform = platform
         rendered_template = render_jinja_template(mock_device, "logger", "{{ obj.platform }}")
         self.assertEqual(rendered_template, platform)
+        self.assertIs(type(rendered_template), str)
 
     @patch("nautobot.dcim.models.Device")
     def test_render_jinja_template_success_with_filter(self, mock_device):
@@ -145,6 +152,23 @@ class HelpersTest(TestCase):  # pylint: disable=too-many-instance-attributes
         rendered_template = render_jinja_template(mock_device, "logger", "{{ data | return_a }}")
         self.assertEqual(rendered_template, "a")
 
+    @patch("nautobot.dcim.models.Device")
+    @patch("nautobot_golden_config.utilities.helper._get_jinja_template")
+    def test_render_jinja_template_literal(self, template_mock, mock_device):
+        """Test a template without any Jinja syntax is returned without being compiled."""
+        self.assertEqual(render_jinja_template(mock_device, "logger", "configs/device.cfg"), "configs/device.cfg")
+        template_mock.assert_not_called()
+
+    @patch("nautobot.dcim.models.Device")
+    def test_render_jinja_template_compiled_once(self, mock_device):
+        """Test the same template string is only compiled once."""
+        mock_device.name = "test_device"
+        with patch("nautobot_golden_config.utilities.helper.engines") as mock_engines:
+            mock_engines.__getitem__.return_value.from_string.return_value.render.return_value = "rendered"
+            for _ in range(2):
+                render_jinja_template(mock_device, "logger", "{{ obj.name }}-compiled-once")
+            mock_engines.__getitem__.return_value.from_string.assert_called_once_with("{{ obj.name }}-compiled-once")
+
     @patch("nautobot.dcim.models.Device")
     def test_render_filters_work(self, mock_device):
         """Test Jinja filters are still there."""
@@ -176,13 +200,13 @@ class HelpersTest(TestCase):  # pylint: disable=too-many-instance-attributes
 
     @patch("nautobot_golden_config.utilities.logger.NornirLogger")
     @patch("nautobot.dcim.models.Device")
-    @patch("nautobot_golden_config.utilities.helper.render_jinja2")
+    @patch("nautobot_golden_config.utilities.helper._get_jinja_template")
     def test_render_jinja_template_exceptions_templateerror(self, template_mock, mock_device, mock_nornir_logger):
         """Cause issue to cause TemplateError form Jinja2 Template."""
         with self.assertRaises(NornirNautobotException):
             with self.assertRaises(jinja_errors.TemplateError):
-                template_mock.side_effect = jinja_errors.TemplateRuntimeError
-                render_jinja_template(mock_device, mock_nornir_logger, "template")
+                template_mock.return_value.render.side_effect = jinja_errors.TemplateRuntimeError
+                render_jinja_template(mock_device, mock_nornir_logger, "{{ template }}")
         mock_nornir_logger.error.assert_called_once()
 
     def test_get_backup_repository_dir_success(self):
@@ -295,3 +319,35 @@ class HelpersTest(TestCase):  # pylint: disable=too-many-instance-attributes
         self.assertEqual(self.device_to_settings_map[test_device.id], self.test_settings_c)
         self.assertEqual(self.device_to_settings_map[orphan_device.id], self.test_settings_b)
         self.assertEqual(get_device_to_settings_map(queryset=Device.objects.none()), {})
+
+    def test_get_django_env_bytecode_cache_disabled(self):
+        """Verify no bytecode cache is used unless a directory is configured."""
+        self.assertIsNone(get_django_env().bytecode_cache)
+
+    def test_get_django_env_bytecode_cache(self):
+        """Verify the bytecode cache directory is created and its file names follow the jinja_env options."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache_dir = os.path.join(temp_dir, "jinja_cache")
+            with patch("nautobot_golden_config.utilities.helper.JINJA_BYTECODE_CACHE_DIR", cache_dir):
+                jinja_env = get_django_env()
+                self.assertIsInstance(jinja_env.bytecode_cache, FileSystemBytecodeCache)
+                self.assertTrue(os.path.isdir(cache_dir))
+                self.assertEqual(jinja_env.bytecode_cache.directory, cache_dir)
+
+                with patch.dict(
+                    "nautobot_golden_config.utilities.helper.JINJA_ENV",
+                    {"lstrip_blocks": not jinja_env.lstrip_blocks},
+                ):
+                    changed_jinja_env = get_django_env()
+                self.assertNotEqual(jinja_env.bytecode_cache.pattern, changed_jinja_env.bytecode_cache.pattern)
+
+    def test_device_to_settings_map_query_count(self):
+        """Verify the number of queries does not grow with the number of devices."""
+        with CaptureQueriesContext(connection) as single_device_queries:
+            get_device_to_settings_map(queryset=Device.objects.filter(name="test_device"))
+        with CaptureQueriesContext(connection) as all_device_queries:
+            device_to_settings_map = get_device_to_settings_map(queryset=Device.objects.all())
+            for settings in device_to_settings_map.values():
+                self.assertIsNotNone(settings.intended_repository.filesystem_path)
+                self.assertIsNotNone(settings.sot_agg_query.query)
+        self.assertEqual(len(all_device_queries), len(single_device_queries))
@@ -26,3 +26,5 @@ if not JINJA_ENV.get("undefined"):
     raise ValueError("The `jinja_env` setting did not include the required key for `undefined`.")
 if isinstance(JINJA_ENV["undefined"], str):
     JINJA_ENV["undefined"] = import_string(JINJA_ENV["undefined"])
+
+JINJA_BYTECODE_CACHE_DIR = PLUGIN_CFG["jinja_bytecode_cache_dir"]
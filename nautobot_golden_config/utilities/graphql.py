@@ -1,10 +1,12 @@
 """Example code to execute GraphQL query from the ORM."""
 
 import logging
+from functools import lru_cache
 
 from django.utils.module_loading import import_string
 from graphene_django.settings import graphene_settings
-from graphql import get_default_backend
+from graphql import execute, get_default_backend, validate
+from graphql.execution import ExecutionResult
 from graphql.error import GraphQLSyntaxError
 
 from nautobot_golden_config.utilities.constant import PLUGIN_CFG
@@ -12,25 +14,35 @@ from nautobot_golden_config.utilities.constant import PLUGIN_CFG
 LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=128)
+def _get_document(query):
+    """Parse and validate a query once per process, every device then executes the same document."""
+    document = get_default_backend().document_from_string(graphene_settings.SCHEMA, query)
+    return document, validate(graphene_settings.SCHEMA, document.document_ast)
+
+
 def graph_ql_query(request, device, query):
     """Function to run graphql and transposer command."""
     LOGGER.debug("GraphQL - request for `%s`", str(device))
-    backend = get_default_backend()
-    schema = graphene_settings.SCHEMA
-
     LOGGER.debug("GraphQL - set query variable to device.")
     variables = {"device_id": str(device.pk)}
 
     try:
         LOGGER.debug("GraphQL - test query: `%s`", str(query))
-        document = backend.document_from_string(schema, query)
+        document, validation_errors = _get_document(query)
 
     except GraphQLSyntaxError as error:
         LOGGER.warning("GraphQL - test query Failed: `%s`", str(query))
         return (400, {"error": str(error)})
 
     LOGGER.debug("GraphQL - execute query with variables")
-    result = document.execute(context_value=request, variable_values=variables)
+    if validation_errors:
+        result = ExecutionResult(errors=validation_errors, invalid=True)
+    else:
+        # `document.execute()` would validate the query again on every call.
+        result = execute(
+            graphene_settings.SCHEMA, document.document_ast, context_value=request, variable_values=variables
+        )
     if result.invalid:
         LOGGER.warning("GraphQL - query executed unsuccessfully")
         return (400, result.to_dict())
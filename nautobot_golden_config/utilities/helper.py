@@ -1,6 +1,9 @@
 """Helper functions."""
 # pylint: disable=raise-missing-from
+import hashlib
 import json
+import os
+from functools import lru_cache
 
 from django.conf import settings
 from django.contrib import messages
@@ -9,17 +12,17 @@ from django.template import engines
 from django.utils.html import format_html
 from django.urls import reverse
 
+from jinja2 import FileSystemBytecodeCache
 from jinja2 import exceptions as jinja_errors
 from jinja2.sandbox import SandboxedEnvironment
 from nautobot.dcim.filters import DeviceFilterSet
 from nautobot.dcim.models import Device
-from nautobot.core.utils.data import render_jinja2
 from nautobot.extras.models import Job
 from nornir_nautobot.exceptions import NornirNautobotException
 
 from nautobot_golden_config import models
 from nautobot_golden_config.utilities import utils
-from nautobot_golden_config.utilities.constant import JINJA_ENV
+from nautobot_golden_config.utilities.constant import JINJA_BYTECODE_CACHE_DIR, JINJA_ENV
 from nautobot_golden_config import config as app_config
 
 
@@ -120,9 +123,23 @@ def get_django_env():
     # Use a custom Jinja2 environment instead of Django's to avoid HTML escaping
     jinja_env = SandboxedEnvironment(**JINJA_ENV)
     jinja_env.filters = engines["jinja"].env.filters
+    if JINJA_BYTECODE_CACHE_DIR:
+        # The cached bytecode depends on the environment options, not only the template source, so they are part
+        # of the cache file names and changing `jinja_env` does not pick up stale bytecode.
+        options_key = hashlib.sha256(repr(sorted(JINJA_ENV.items())).encode()).hexdigest()[:12]
+        os.makedirs(JINJA_BYTECODE_CACHE_DIR, exist_ok=True)
+        jinja_env.bytecode_cache = FileSystemBytecodeCache(
+            directory=JINJA_BYTECODE_CACHE_DIR, pattern=f"__nautobot_gc_jinja2_{options_key}_%s.cache"
+        )
     return jinja_env
 
 
+@lru_cache(maxsize=512)
+def _get_jinja_template(template):
+    """Compile a template string once per process, with the same engine `render_jinja2` renders with."""
+    return engines["jinja"].from_string(template)
+
+
 def render_jinja_template(obj, logger, template):
     """
     Helper function to render Jinja templates.
@@ -138,8 +155,12 @@ def render_jinja_template(obj, logger, template):
     Raises:
         NornirNautobotException: When there is an error rendering the ``template``.
     """
+    # Plain paths render to themselves, as long as there is no newline for Jinja to normalize or strip.
+    if "{" not in template and "\n" not in template and "\r" not in template:
+        return template
     try:
-        return render_jinja2(template_code=template, context={"obj": obj})
+        # django_jinja marks the output safe; concatenating with a str drops the marker, as `render_jinja2` does.
+        return "" + _get_jinja_template(template).render(context={"obj": obj})
     except jinja_errors.UndefinedError as error:
         error_msg = (
             "`E3019:` Jinja encountered and UndefinedError`, check the template for missing variable definitions.\n"
@@ -171,12 +192,16 @@ def render_jinja_template(obj, logger, template):
 def get_device_to_settings_map(queryset):
     """Helper function to map settings to devices."""
     device_to_settings_map = {}
-    for device in queryset:
-        dynamic_group = device.dynamic_groups.exclude(golden_config_setting__isnull=True).order_by(
-            "-golden_config_setting__weight"
-        )
-        if dynamic_group.exists():
-            device_to_settings_map[device.id] = dynamic_group.first().golden_config_setting
+    device_pks = queryset.values("pk")
+    # Resolve the members of each setting's dynamic group once, rather than every group's membership per device.
+    # Settings are ordered from the highest weight down, so each device keeps the first setting it is a member of.
+    # All devices of a setting share one instance, with the relations the jobs read already joined.
+    for golden_config_setting in models.GoldenConfigSetting.objects.select_related(
+        "dynamic_group", "backup_repository", "intended_repository", "jinja_repository", "sot_agg_query"
+    ):
+        members = golden_config_setting.dynamic_group.members
+        for device_pk in members.filter(pk__in=device_pks).values_list("pk", flat=True):
+            device_to_settings_map.setdefault(device_pk, golden_config_setting)
     return device_to_settings_map
 
 
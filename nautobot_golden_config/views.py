@@ -413,7 +413,7 @@ class ComplianceRuleUIViewSet(views.NautobotUIViewSet):
     filterset_class = filters.ComplianceRuleFilterSet
     filterset_form_class = forms.ComplianceRuleFilterForm
     form_class = forms.ComplianceRuleForm
-    queryset = models.ComplianceRule.objects.all()
+    queryset = models.ComplianceRule.objects.select_related("feature", "platform")
     serializer_class = serializers.ComplianceRuleSerializer
     table_class = tables.ComplianceRuleTable
     lookup_field = "pk"